@@ -0,0 +1,70 @@
+"""
+Startup-time benchmark for the fieldroutes_pipeline code location
+
+Dagster re-imports fieldroutes_pipeline.definitions for every run worker and
+sensor tick, so this measures a cold import in a fresh interpreter (the same
+thing those processes pay) and checks that heavy dependencies are not loaded
+until an asset actually executes.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--module fieldroutes_pipeline.definitions]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Dependencies that should only be imported at execution time
+HEAVY_MODULES = ["pandas", "snowflake.connector", "requests", "aiohttp"]
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def time_import(module, repo_root):
+    """Import module in a fresh interpreter and return its timing result"""
+    snippet = IMPORT_SNIPPET.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.check_output(
+        [sys.executable, "-c", snippet],
+        cwd=repo_root
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Number of cold imports to time")
+    parser.add_argument("--module", default="fieldroutes_pipeline.definitions", help="Module to import")
+    args = parser.parse_args()
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # Warm the bytecode and OS file caches so runs are comparable
+    time_import(args.module, repo_root)
+
+    results = [time_import(args.module, repo_root) for _ in range(args.runs)]
+    timings = [r["seconds"] for r in results]
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"{args.module}: {args.runs} cold imports")
+    print(f"  min    {min(timings) * 1000:8.1f} ms")
+    print(f"  median {statistics.median(timings) * 1000:8.1f} ms")
+    print(f"  max    {max(timings) * 1000:8.1f} ms")
+
+    if loaded:
+        print(f"  heavy modules imported at load time: {', '.join(loaded)}")
+        return 1
+
+    print("  no heavy modules imported at load time")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
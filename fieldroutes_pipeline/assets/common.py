@@ -1,7 +1,8 @@
 from dagster import AssetExecutionContext, asset
-import pandas as pd
 from datetime import datetime
 
+from ..utils.tuning import tune_extraction, tune_load_chunk_size
+
 def process_entity(
     context: AssetExecutionContext,
     field_routes_client,
@@ -12,9 +13,20 @@ def process_entity(
     schema="fieldroutes",
     table=None,
     incremental=True,
-    predict_small_dataset=False
+    predict_small_dataset=False,
+    extraction_history=None
 ):
-    """Common processing logic for FieldRoutes entities"""
+    """
+    Common processing logic for FieldRoutes entities
+    
+    When extraction_history is given, past volumes and timings for each
+    office (from the asset's previous materialization) pick the batch size,
+    concurrency and includeData setting, falling back to
+    predict_small_dataset, and this run's stats are added to the history.
+    
+    Returns the record count and asset metadata holding the tuned parameters
+    and the updated history.
+    """
     if table is None:
         table = entity_name.lower()
         
@@ -22,8 +34,13 @@ def process_entity(
     all_offices = field_routes_config.get_all_offices()
     
     all_records = []
+    extract_parameters = {}
     run_time = datetime.utcnow()
     
+    history = {}
+    if extraction_history is not None:
+        history = extraction_history.load(context)
+    
     # Process each office
     for creds, metadata in all_offices:
         context.log.info(f"Processing {entity_name} for office {creds.office_id}")
@@ -31,17 +48,42 @@ def process_entity(
         # Get time window for incremental load
         if incremental:
             time_window = metadata.get_window(run_time)
+            window_hours = (
+                time_window["end_datetime"] - time_window["start_datetime"]
+            ).total_seconds() / 3600
         else:
             # For full refresh, don't use time filters
             time_window = {}
+            window_hours = None
+            
+        # Tune extraction from this office's history
+        tuning = tune_extraction(
+            history.get(creds.office_id, []),
+            default_include_data=predict_small_dataset,
+            window_hours=window_hours
+        )
+        extract_parameters[str(creds.office_id)] = tuning
+        if tuning["forecast_records"] is None:
+            forecast = "no history, using defaults"
+        else:
+            forecast = f"forecast {tuning['forecast_records']} records"
+        context.log.info(
+            f"Extracting {entity_name} for office {creds.office_id} with "
+            f"batch_size={tuning['batch_size']}, concurrency={tuning['concurrency']}, "
+            f"include_data={tuning['include_data']} ({forecast})"
+        )
             
         try:
             # Extract the data
+            stats = {}
             records = field_routes_client.extract_entity(
                 creds, 
                 entity_name, 
                 time_window,
-                predict_size=predict_small_dataset
+                batch_size=tuning["batch_size"],
+                predict_size=tuning["include_data"],
+                concurrency=tuning["concurrency"],
+                stats=stats
             )
             
             # Add metadata
@@ -51,6 +93,15 @@ def process_entity(
                 
             all_records.extend(records)
             
+            if extraction_history is not None:
+                extraction_history.record_run(
+                    history,
+                    creds.office_id,
+                    run_time,
+                    stats,
+                    window_hours=window_hours
+                )
+            
             # Update last successful run
             if incremental:
                 field_routes_config.update_last_run(
@@ -65,16 +116,24 @@ def process_entity(
             raise
             
     # Convert to DataFrame
+    load_chunk_size = None
     if all_records:
+        # Imported here so loading the code location doesn't pull in pandas
+        import pandas as pd
+        
         df = pd.DataFrame(all_records)
         
+        # Size load chunks from the DataFrame's in-memory bytes per row
+        load_chunk_size = tune_load_chunk_size(len(df), df.memory_usage(deep=True).sum() / len(df))
+        
         # Save to Snowflake
         result = snowflake_io.load_dataframe(
             df, 
             database, 
             schema, 
             table, 
-            mode="append" if incremental else "overwrite"
+            mode="append" if incremental else "swap",
+            chunk_size=load_chunk_size
         )
         
         context.log.info(
@@ -83,4 +142,11 @@ def process_entity(
     else:
         context.log.info(f"No {entity_name} records found to load")
         
-    return len(all_records)
+    tuning_metadata = {
+        "extract_parameters": extract_parameters,
+        "load_chunk_size": load_chunk_size or len(all_records)
+    }
+    if extraction_history is not None:
+        tuning_metadata.update(extraction_history.to_metadata(history))
+    
+    return len(all_records), tuning_metadata
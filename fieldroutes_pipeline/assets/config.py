@@ -1,7 +1,10 @@
 import os
 import yaml
 from datetime import datetime, timedelta
-from dagster import Config, ConfigurableResource, Field, StringSource
+from dagster import Config, ConfigurableResource, StringSource
+from pydantic import Field
+
+from ..utils.tuning import add_history_entry
 
 class FieldRoutesCredentials(Config):
     """Configuration for FieldRoutes office credentials"""
@@ -78,3 +81,54 @@ class FieldRoutesConfig(ConfigurableResource):
                 
         with open(self.config_path, 'w') as f:
             yaml.dump(config, f)
+
+class ExtractionHistory(ConfigurableResource):
+    """
+    Resource that tracks per-(entity, office) extraction volumes and timings
+    
+    The history travels in each asset's materialization metadata and is read
+    back from the latest materialization, so it persists in Dagster's event
+    log even though every run starts in a fresh container.
+    """
+    metadata_key: str = Field(
+        default="extraction_history",
+        description="Asset metadata entry holding the extraction history"
+    )
+    max_entries: int = Field(
+        default=30,
+        description="Number of most recent runs kept per office"
+    )
+    
+    def load(self, context):
+        """Get {office_id: [runs, oldest first]} from the asset's latest materialization"""
+        event = context.instance.get_latest_materialization_event(context.asset_key)
+        if event is None or event.asset_materialization is None:
+            return {}
+            
+        value = event.asset_materialization.metadata.get(self.metadata_key)
+        if value is None:
+            return {}
+            
+        # JSON metadata stores office IDs as strings
+        return {int(office_id): entries for office_id, entries in value.value.items()}
+        
+    def record_run(self, history, office_id, run_time, stats, window_hours=None):
+        """
+        Append the stats of a completed extraction to history in place
+        
+        window_hours is the length of the incremental window extracted, or
+        None for a full refresh
+        """
+        history[office_id] = add_history_entry(
+            history.get(office_id, []),
+            run_time,
+            stats,
+            self.max_entries,
+            window_hours=window_hours
+        )
+        
+    def to_metadata(self, history):
+        """Asset metadata entry that carries history to the next run"""
+        return {
+            self.metadata_key: {str(office_id): entries for office_id, entries in history.items()}
+        }
@@ -5,11 +5,11 @@ from .common import process_entity
     group_name="fieldroutes_dimensions",
     compute_kind="FieldRoutes API",
     io_manager_key="snowflake_io",
-    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config"}
+    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"}
 )
-def customer_dim(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config):
+def customer_dim(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config, extraction_history):
     """Extract Customer dimension from FieldRoutes"""
-    record_count = process_entity(
+    record_count, tuning_metadata = process_entity(
         context,
         field_routes_client,
         snowflake_io,
@@ -19,7 +19,8 @@ def customer_dim(context: AssetExecutionContext, field_routes_client, snowflake_
         schema="fieldroutes",
         table="customers",
         incremental=True,
-        predict_small_dataset=True  # Per playbook, customers usually < 1000 per day
+        predict_small_dataset=True,  # Per playbook, customers usually < 1000 per day
+        extraction_history=extraction_history
     )
     
     return Output(
@@ -27,7 +28,8 @@ def customer_dim(context: AssetExecutionContext, field_routes_client, snowflake_
         metadata={
             "record_count": record_count,
             "schema": "fieldroutes",
-            "table": "customers"
+            "table": "customers",
+            **tuning_metadata
         }
     )
     
@@ -35,11 +37,11 @@ def customer_dim(context: AssetExecutionContext, field_routes_client, snowflake_
     group_name="fieldroutes_dimensions",
     compute_kind="FieldRoutes API",
     io_manager_key="snowflake_io",
-    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config"}
+    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"}
 )
-def employee_dim(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config):
+def employee_dim(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config, extraction_history):
     """Extract Employee dimension from FieldRoutes"""
-    record_count = process_entity(
+    record_count, tuning_metadata = process_entity(
         context,
         field_routes_client,
         snowflake_io,
@@ -49,7 +51,8 @@ def employee_dim(context: AssetExecutionContext, field_routes_client, snowflake_
         schema="fieldroutes",
         table="employees",
         incremental=False,  # Full refresh fine for low volume
-        predict_small_dataset=True
+        predict_small_dataset=True,
+        extraction_history=extraction_history
     )
     
     return Output(
@@ -57,7 +60,8 @@ def employee_dim(context: AssetExecutionContext, field_routes_client, snowflake_
         metadata={
             "record_count": record_count,
             "schema": "fieldroutes",
-            "table": "employees"
+            "table": "employees",
+            **tuning_metadata
         }
     )
 
@@ -65,11 +69,11 @@ def employee_dim(context: AssetExecutionContext, field_routes_client, snowflake_
     group_name="fieldroutes_dimensions",
     compute_kind="FieldRoutes API",
     io_manager_key="snowflake_io",
-    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config"}
+    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"}
 )
-def office_dim(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config):
+def office_dim(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config, extraction_history):
     """Extract Office dimension from FieldRoutes"""
-    record_count = process_entity(
+    record_count, tuning_metadata = process_entity(
         context,
         field_routes_client,
         snowflake_io,
@@ -79,7 +83,8 @@ def office_dim(context: AssetExecutionContext, field_routes_client, snowflake_io
         schema="fieldroutes",
         table="offices",
         incremental=False,  # Always full refresh for 17 static records
-        predict_small_dataset=True
+        predict_small_dataset=True,
+        extraction_history=extraction_history
     )
     
     return Output(
@@ -87,7 +92,8 @@ def office_dim(context: AssetExecutionContext, field_routes_client, snowflake_io
         metadata={
             "record_count": record_count,
             "schema": "fieldroutes",
-            "table": "offices"
+            "table": "offices",
+            **tuning_metadata
         }
     )
 
@@ -13,12 +13,12 @@ dimension_dependencies = [
     group_name="fieldroutes_facts",
     compute_kind="FieldRoutes API",
     io_manager_key="snowflake_io",
-    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config"},
+    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"},
     deps=dimension_dependencies
 )
-def appointment_fact(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config):
+def appointment_fact(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config, extraction_history):
     """Extract Appointment fact from FieldRoutes"""
-    record_count = process_entity(
+    record_count, tuning_metadata = process_entity(
         context,
         field_routes_client,
         snowflake_io,
@@ -28,7 +28,8 @@ def appointment_fact(context: AssetExecutionContext, field_routes_client, snowfl
         schema="fieldroutes",
         table="appointments",
         incremental=True,
-        predict_small_dataset=False  # High volume, do not use includeData
+        predict_small_dataset=False,  # High volume, do not use includeData
+        extraction_history=extraction_history
     )
     
     return Output(
@@ -36,7 +37,8 @@ def appointment_fact(context: AssetExecutionContext, field_routes_client, snowfl
         metadata={
             "record_count": record_count,
             "schema": "fieldroutes",
-            "table": "appointments"
+            "table": "appointments",
+            **tuning_metadata
         }
     )
 
@@ -44,12 +46,12 @@ def appointment_fact(context: AssetExecutionContext, field_routes_client, snowfl
     group_name="fieldroutes_facts",
     compute_kind="FieldRoutes API",
     io_manager_key="snowflake_io",
-    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config"},
+    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"},
     deps=dimension_dependencies
 )
-def subscription_fact(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config):
+def subscription_fact(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config, extraction_history):
     """Extract Subscription fact from FieldRoutes"""
-    record_count = process_entity(
+    record_count, tuning_metadata = process_entity(
         context,
         field_routes_client,
         snowflake_io,
@@ -59,7 +61,8 @@ def subscription_fact(context: AssetExecutionContext, field_routes_client, snowf
         schema="fieldroutes",
         table="subscriptions",
         incremental=True,
-        predict_small_dataset=False
+        predict_small_dataset=False,
+        extraction_history=extraction_history
     )
     
     return Output(
@@ -67,7 +70,8 @@ def subscription_fact(context: AssetExecutionContext, field_routes_client, snowf
         metadata={
             "record_count": record_count,
             "schema": "fieldroutes",
-            "table": "subscriptions"
+            "table": "subscriptions",
+            **tuning_metadata
         }
     )
 
@@ -75,12 +79,12 @@ def subscription_fact(context: AssetExecutionContext, field_routes_client, snowf
     group_name="fieldroutes_facts",
     compute_kind="FieldRoutes API",
     io_manager_key="snowflake_io",
-    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config"},
+    required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"},
     deps=dimension_dependencies
 )
-def payment_fact(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config):
+def payment_fact(context: AssetExecutionContext, field_routes_client, snowflake_io, field_routes_config, extraction_history):
     """Extract Payment fact from FieldRoutes"""
-    record_count = process_entity(
+    record_count, tuning_metadata = process_entity(
         context,
         field_routes_client,
         snowflake_io,
@@ -90,7 +94,8 @@ def payment_fact(context: AssetExecutionContext, field_routes_client, snowflake_
         schema="fieldroutes",
         table="payments",
         incremental=True,
-        predict_small_dataset=False  # High volume per playbook
+        predict_small_dataset=False,  # High volume per playbook
+        extraction_history=extraction_history
     )
     
     return Output(
@@ -98,7 +103,8 @@ def payment_fact(context: AssetExecutionContext, field_routes_client, snowflake_
         metadata={
             "record_count": record_count,
             "schema": "fieldroutes",
-            "table": "payments"
+            "table": "payments",
+            **tuning_metadata
         }
     )
 
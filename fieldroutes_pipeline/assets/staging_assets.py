@@ -1,5 +1,4 @@
 from dagster import asset, AssetExecutionContext, Output, AssetIn, AssetKey
-import pandas as pd
 
 @asset(
     group_name="fieldroutes_staging",
@@ -13,7 +13,7 @@ from .assets.staging_assets import (
     # Import other staging assets
 )
 
-from .assets.config import FieldRoutesConfig
+from .assets.config import FieldRoutesConfig, ExtractionHistory
 from .resources.fieldroutes_client import FieldRoutesClient
 from .resources.snowflake_io import SnowflakeIO
 
@@ -67,7 +67,8 @@ defs = Definitions(
     resources={
         "field_routes_client": FieldRoutesClient(),
         "snowflake_io": SnowflakeIO(),
-        "field_routes_config": FieldRoutesConfig()
+        "field_routes_config": FieldRoutesConfig(),
+        "extraction_history": ExtractionHistory()
     },
     schedules=[nightly_schedule, hourly_hot_tables],
     jobs=[dimension_job, fact_job, staging_job]
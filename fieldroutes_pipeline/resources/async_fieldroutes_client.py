@@ -0,0 +1,242 @@
+import asyncio
+import time
+from dagster import ConfigurableResource
+from pydantic import Field
+
+from ..utils.rate_limit import AsyncRateLimiter
+
+# Batches of one entity fetched at once unless a caller asks otherwise
+DEFAULT_BATCH_CONCURRENCY = 4
+
+class FieldRoutesSession:
+    """An aiohttp session plus the rate limiter shared by all its requests"""
+
+    def __init__(self, http, limiter):
+        self.http = http
+        self.limiter = limiter
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.http.close()
+
+class AsyncFieldRoutesClient(ConfigurableResource):
+    """
+    asyncio client for the FieldRoutes API
+
+    Mirrors FieldRoutesClient but every request and backoff is non-blocking,
+    so a single thread can keep many requests in flight. Methods take a
+    session from open_session(); every request made through one session
+    shares its connections and a single throttle_sleep rate limit, so the
+    request rate matches FieldRoutesClient however many are in flight.
+    """
+    max_retries: int = Field(default=3, description="Maximum number of retry attempts")
+    retry_delay: float = Field(default=1.0, description="Initial delay between retries in seconds")
+    throttle_sleep: float = Field(default=0.5, description="Sleep time between requests to avoid throttling")
+    max_concurrency: int = Field(default=100, description="Maximum number of in-flight requests per session")
+
+    def open_session(self):
+        """Open a rate-limited session capped at max_concurrency connections"""
+        import aiohttp  # Deferred so importing the code location stays cheap
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        return FieldRoutesSession(
+            aiohttp.ClientSession(connector=connector),
+            AsyncRateLimiter(self.throttle_sleep)
+        )
+
+    async def _make_request(self, session, method, url, data=None, auth=None, stats=None):
+        """
+        Make HTTP request with retry logic
+
+        If a stats dict is given, the request count, response size and
+        latency of the successful attempt are added to it
+        """
+        import aiohttp
+
+        retry_count = 0
+        while True:
+            try:
+                await session.limiter.wait()  # Respect rate limits
+
+                start = time.perf_counter()
+                if method == "GET":
+                    request = session.http.get(url, params=data, headers=auth)
+                else:  # POST
+                    request = session.http.post(url, json=data, headers=auth)
+
+                async with request as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                    result = await response.json(content_type=None)
+
+                if stats is not None:
+                    stats["requests"] = stats.get("requests", 0) + 1
+                    stats["response_bytes"] = stats.get("response_bytes", 0) + len(body)
+                    stats["latency_seconds"] = stats.get("latency_seconds", 0.0) + time.perf_counter() - start
+
+                return result
+
+            # ValueError covers non-JSON bodies, which requests also retries
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                if retry_count < self.max_retries:
+                    wait_time = self.retry_delay * (2 ** retry_count)  # Exponential backoff
+                    await asyncio.sleep(wait_time)
+                    retry_count += 1
+                else:
+                    raise Exception(f"Request failed after {self.max_retries} retries: {str(e)}")
+
+    def get_auth_headers(self, credentials):
+        """Convert credentials to headers format"""
+        return {
+            "authenticationKey": credentials.auth_key,
+            "authenticationToken": credentials.auth_token,
+            "Content-Type": "application/json"
+        }
+
+    async def search_entity(self, session, credentials, entity, params, include_data=False, stats=None):
+        """Execute a search request to get IDs or data for an entity"""
+        url = f"{credentials.base_url}/{entity}/search"
+        auth = self.get_auth_headers(credentials)
+
+        # Always include office ID and include_data flag
+        data = {
+            **params,
+            "officeIDs": credentials.office_id,
+            "includeData": 1 if include_data else 0
+        }
+
+        return await self._make_request(session, "POST", url, data, auth, stats=stats)
+
+    async def get_entity_batch(self, session, credentials, entity, ids, stats=None):
+        """Get a batch of entities by IDs"""
+        if not ids:
+            return []
+
+        url = f"{credentials.base_url}/{entity}/get"
+        auth = self.get_auth_headers(credentials)
+
+        # FieldRoutes expects entity + IDs as the parameter name
+        data = {
+            f"{entity}IDs": ids,
+            "officeIDs": credentials.office_id
+        }
+
+        return await self._make_request(session, "POST", url, data, auth, stats=stats)
+
+    async def extract_entity(self, session, credentials, entity, time_window, batch_size=1000, predict_size=False,
+                             concurrency=DEFAULT_BATCH_CONCURRENCY, stats=None):
+        """
+        Extract an entity with proper pagination handling
+
+        Same semantics as FieldRoutesClient.extract_entity, except that up to
+        concurrency batches of unresolved IDs are fetched at once
+        """
+        search_results = await self.search_entity(
+            session,
+            credentials,
+            entity,
+            time_window,
+            include_data=predict_size,
+            stats=stats
+        )
+
+        # The first 1,000 records may be included directly
+        records = search_results.get("resolvedObjects", [])
+
+        # Check if there are unresolved IDs (more than initial 1,000)
+        unresolved_ids = search_results.get(f"{entity}IDsNoDataExported", [])
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_batch(batch_ids):
+            async with semaphore:
+                return await self.get_entity_batch(session, credentials, entity, batch_ids, stats=stats)
+
+        # gather keeps the batches in request order
+        batches = await asyncio.gather(*[
+            fetch_batch(unresolved_ids[i:i+batch_size])
+            for i in range(0, len(unresolved_ids), batch_size)
+        ])
+        for batch_data in batches:
+            records.extend(batch_data)
+
+        if stats is not None:
+            stats["records"] = len(records)
+
+        return records
+
+    async def extract_entities(self, jobs):
+        """
+        Extract several (credentials, entity, time_window) jobs concurrently
+
+        Each job is a dict of extract_entity keyword arguments. Returns the
+        record lists in the same order as jobs.
+        """
+        async with self.open_session() as session:
+            return await asyncio.gather(*[
+                self.extract_entity(session, **job) for job in jobs
+            ])
+
+
+class SyncFieldRoutesClient(ConfigurableResource):
+    """
+    Blocking adapter over AsyncFieldRoutesClient
+
+    Exposes the FieldRoutesClient interface so existing assets can use the
+    async engine unchanged. Each call runs its own event loop.
+    """
+    max_retries: int = Field(default=3, description="Maximum number of retry attempts")
+    retry_delay: float = Field(default=1.0, description="Initial delay between retries in seconds")
+    throttle_sleep: float = Field(default=0.5, description="Sleep time between requests to avoid throttling")
+    max_concurrency: int = Field(default=100, description="Maximum number of in-flight requests per call")
+
+    def _get_async_client(self):
+        """Build the async client from this resource's config"""
+        return AsyncFieldRoutesClient(
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            throttle_sleep=self.throttle_sleep,
+            max_concurrency=self.max_concurrency
+        )
+
+    def _run(self, method_name, *args, **kwargs):
+        """Run one async client method to completion in a fresh session"""
+        client = self._get_async_client()
+
+        async def runner():
+            async with client.open_session() as session:
+                return await getattr(client, method_name)(session, *args, **kwargs)
+
+        return asyncio.run(runner())
+
+    def get_auth_headers(self, credentials):
+        """Convert credentials to headers format"""
+        return self._get_async_client().get_auth_headers(credentials)
+
+    def search_entity(self, credentials, entity, params, include_data=False, stats=None):
+        """Execute a search request to get IDs or data for an entity"""
+        return self._run("search_entity", credentials, entity, params, include_data=include_data, stats=stats)
+
+    def get_entity_batch(self, credentials, entity, ids, stats=None):
+        """Get a batch of entities by IDs"""
+        return self._run("get_entity_batch", credentials, entity, ids, stats=stats)
+
+    def extract_entity(self, credentials, entity, time_window, batch_size=1000, predict_size=False,
+                       concurrency=DEFAULT_BATCH_CONCURRENCY, stats=None):
+        """Extract an entity with proper pagination handling"""
+        return self._run(
+            "extract_entity",
+            credentials,
+            entity,
+            time_window,
+            batch_size=batch_size,
+            predict_size=predict_size,
+            concurrency=concurrency,
+            stats=stats
+        )
+
+    def extract_entities(self, jobs):
+        """Extract several jobs concurrently; see AsyncFieldRoutesClient.extract_entities"""
+        return asyncio.run(self._get_async_client().extract_entities(jobs))
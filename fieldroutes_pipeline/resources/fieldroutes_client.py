@@ -1,31 +1,56 @@
-import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from dagster import ConfigurableResource, Field
+from dagster import ConfigurableResource
+from pydantic import Field
+
+from ..utils.rate_limit import RateLimiter
 
 class FieldRoutesClient(ConfigurableResource):
     """Client for interacting with FieldRoutes API"""
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
     retry_delay: float = Field(default=1.0, description="Initial delay between retries in seconds")
-    throttle_sleep: float = Field(default=0.5, description="Sleep time between requests to avoid throttling")
+    throttle_sleep: float = Field(
+        default=0.5,
+        description="Sleep time between requests to avoid throttling; with concurrent batches, "
+                    "the minimum gap between request starts"
+    )
     
-    def _make_request(self, method, url, data=None, auth=None, retry_count=0):
-        """Make HTTP request with retry logic"""
+    def _make_request(self, method, url, data=None, auth=None, retry_count=0, stats=None, limiter=None):
+        """
+        Make HTTP request with retry logic
+        
+        If a stats dict is given, the request count, response size and
+        latency of the successful attempt are added to it. If a shared
+        RateLimiter is given it paces the request instead of sleeping after it.
+        """
+        import requests  # Deferred so importing the code location stays cheap
+        
         try:
+            if limiter is not None:
+                limiter.wait()  # Respect rate limits across threads
+                
+            start = time.perf_counter()
             if method == "GET":
                 response = requests.get(url, params=data, headers=auth)
             else:  # POST
                 response = requests.post(url, json=data, headers=auth)
                 
             response.raise_for_status()
-            time.sleep(self.throttle_sleep)  # Respect rate limits
+            if stats is not None:
+                stats["requests"] = stats.get("requests", 0) + 1
+                stats["response_bytes"] = stats.get("response_bytes", 0) + len(response.content)
+                stats["latency_seconds"] = stats.get("latency_seconds", 0.0) + time.perf_counter() - start
+                
+            if limiter is None:
+                time.sleep(self.throttle_sleep)  # Respect rate limits
             return response.json()
             
         except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as e:
             if retry_count < self.max_retries:
                 wait_time = self.retry_delay * (2 ** retry_count)  # Exponential backoff
                 time.sleep(wait_time)
-                return self._make_request(method, url, data, auth, retry_count + 1)
+                return self._make_request(method, url, data, auth, retry_count + 1, stats, limiter)
             else:
                 raise Exception(f"Request failed after {self.max_retries} retries: {str(e)}")
     
@@ -37,7 +62,7 @@ class FieldRoutesClient(ConfigurableResource):
             "Content-Type": "application/json"
         }
     
-    def search_entity(self, credentials, entity, params, include_data=False):
+    def search_entity(self, credentials, entity, params, include_data=False, stats=None, limiter=None):
         """Execute a search request to get IDs or data for an entity"""
         url = f"{credentials.base_url}/{entity}/search"
         auth = self.get_auth_headers(credentials)
@@ -49,9 +74,9 @@ class FieldRoutesClient(ConfigurableResource):
             "includeData": 1 if include_data else 0
         }
         
-        return self._make_request("POST", url, data, auth)
+        return self._make_request("POST", url, data, auth, stats=stats, limiter=limiter)
     
-    def get_entity_batch(self, credentials, entity, ids):
+    def get_entity_batch(self, credentials, entity, ids, stats=None, limiter=None):
         """Get a batch of entities by IDs"""
         if not ids:
             return []
@@ -65,14 +90,21 @@ class FieldRoutesClient(ConfigurableResource):
             "officeIDs": credentials.office_id
         }
         
-        return self._make_request("POST", url, data, auth)
+        return self._make_request("POST", url, data, auth, stats=stats, limiter=limiter)
     
-    def extract_entity(self, credentials, entity, time_window, batch_size=1000, predict_size=False):
+    def extract_entity(self, credentials, entity, time_window, batch_size=1000, predict_size=False,
+                       concurrency=1, stats=None):
         """
         Extract an entity with proper pagination handling
         
-        If predict_size is True, will try to use includeData=1 for small datasets
+        If predict_size is True, will try to use includeData=1 for small datasets.
+        Up to concurrency batches are fetched in parallel. Serially, each
+        request is followed by throttle_sleep as before; in parallel, request
+        starts share one throttle_sleep rate limit instead. If a stats dict is
+        given, request counts, response bytes and latency are added to it.
         """
+        limiter = RateLimiter(self.throttle_sleep) if concurrency > 1 else None
+        
         # First, attempt to get a count or make an educated guess on size
         use_include_data = predict_size
         
@@ -86,7 +118,9 @@ class FieldRoutesClient(ConfigurableResource):
             credentials, 
             entity, 
             time_window,
-            include_data=use_include_data
+            include_data=use_include_data,
+            stats=stats,
+            limiter=limiter
         )
         
         # The first 1,000 records may be included directly
@@ -96,9 +130,25 @@ class FieldRoutesClient(ConfigurableResource):
         unresolved_ids = search_results.get(f"{entity}IDsNoDataExported", [])
         
         # If we have unresolved IDs, fetch them in batches
-        for i in range(0, len(unresolved_ids), batch_size):
-            batch_ids = unresolved_ids[i:i+batch_size]
-            batch_data = self.get_entity_batch(credentials, entity, batch_ids)
-            records.extend(batch_data)
+        batch_ids = [
+            unresolved_ids[i:i+batch_size]
+            for i in range(0, len(unresolved_ids), batch_size)
+        ]
+        # One stats dict per batch so worker threads don't share state
+        batch_stats = [{} for _ in batch_ids]
+        
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            batches = executor.map(
+                lambda args: self.get_entity_batch(credentials, entity, args[0], stats=args[1], limiter=limiter),
+                zip(batch_ids, batch_stats)
+            )
+            for batch_data in batches:
+                records.extend(batch_data)
+                
+        if stats is not None:
+            for batch in batch_stats:
+                for key, value in batch.items():
+                    stats[key] = stats.get(key, 0) + value
+            stats["records"] = len(records)
             
         return records
@@ -1,18 +1,23 @@
-import pandas as pd
-from snowflake.connector import connect
-from snowflake.connector.pandas_tools import write_pandas
-from dagster import ConfigurableResource, Field, StringSource
+from dagster import ConfigurableResource
+from pydantic import Field
 
 class SnowflakeIO(ConfigurableResource):
-    """Resource for interacting with Snowflake"""
+    """
+    Resource for interacting with Snowflake
+    
+    snowflake-connector (and pandas via write_pandas) are imported inside the
+    methods that use them, so importing the code location stays cheap.
+    """
     account: str = Field(default=None, description="Snowflake account")
     user: str = Field(default=None, description="Snowflake username")
-    password: str = Field(default=StringSource, description="Snowflake password")
+    password: str = Field(default=None, description="Snowflake password")
     warehouse: str = Field(default="ALTA_COMPUTE_WH", description="Snowflake warehouse")
     role: str = Field(default="ALTA_ETL_ROLE", description="Snowflake role")
     
     def get_connection(self, database=None):
         """Get a Snowflake connection"""
+        from snowflake.connector import connect
+        
         conn_params = {
             "user": self.user,
             "password": self.password,
@@ -54,8 +59,19 @@ class SnowflakeIO(ConfigurableResource):
         finally:
             conn.close()
     
-    def load_dataframe(self, df, database, schema, table, mode="overwrite"):
-        """Load a pandas DataFrame to Snowflake"""
+    def load_dataframe(self, df, database, schema, table, mode="overwrite", chunk_size=None):
+        """Load a pandas DataFrame to Snowflake
+
+        mode is one of "append", "overwrite" (truncate then load) or "swap"
+        (load into a shadow table, then atomically swap it into place).
+        chunk_size is the number of rows per staged file; None loads the
+        DataFrame as a single chunk.
+        """
+        if mode == "swap":
+            return self.swap_dataframe(df, database, schema, table, chunk_size=chunk_size)
+            
+        from snowflake.connector.pandas_tools import write_pandas
+        
         conn = self.get_connection(database)
         
         try:
@@ -75,6 +91,7 @@ class SnowflakeIO(ConfigurableResource):
                 table_name=table,
                 database=database,
                 schema=schema,
+                chunk_size=chunk_size,
                 auto_create_table=True
             )
             
@@ -86,6 +103,94 @@ class SnowflakeIO(ConfigurableResource):
             
         finally:
             conn.close()
+    
+    def quoted_name(self, database, schema, table):
+        """Fully qualified name quoted the way write_pandas quotes identifiers"""
+        return f'"{database}"."{schema}"."{table}"'
+    
+    def table_exists(self, database, schema, table):
+        """Check whether a table exists under its exact (quoted, case-sensitive) name"""
+        result = self.execute_sql(
+            f"""
+            SELECT COUNT(*) FROM "{database}".information_schema.tables
+            WHERE table_schema = %(schema)s AND table_name = %(table)s
+            """,
+            database,
+            {"schema": schema, "table": table}
+        )
+        return bool(result and result[0][0])
+    
+    def swap_dataframe(self, df, database, schema, table, chunk_size=None):
+        """
+        Full-refresh a table without exposing partial data to readers
+        
+        The DataFrame is written to a shadow table which is then swapped with
+        the target in a single ALTER TABLE ... SWAP WITH. If the load fails the
+        target is left untouched.
+        
+        The shadow is created LIKE the target with COPY GRANTS, so reader
+        grants survive the swap. On the first load the shadow is created from
+        the DataFrame and renamed into place. write_pandas quotes identifiers,
+        so every statement here uses the same quoted, case-sensitive names.
+        """
+        from snowflake.connector.pandas_tools import write_pandas
+        
+        shadow_table = f"{table}__shadow"
+        target_name = self.quoted_name(database, schema, table)
+        shadow_name = self.quoted_name(database, schema, shadow_table)
+        
+        # Ensure the schema exists
+        self.create_schema_if_not_exists(database, schema)
+        target_exists = self.table_exists(database, schema, table)
+        
+        conn = self.get_connection(database)
+        
+        try:
+            cursor = conn.cursor()
+            
+            try:
+                # Clear out any shadow table left behind by a failed run, so
+                # COPY GRANTS below copies from the target and not the shadow
+                cursor.execute(f"DROP TABLE IF EXISTS {shadow_name}")
+                
+                if target_exists:
+                    cursor.execute(
+                        f"CREATE TABLE {shadow_name} LIKE {target_name} COPY GRANTS"
+                    )
+                
+                # Load the data into the shadow table
+                success, num_chunks, num_rows, output = write_pandas(
+                    conn=conn,
+                    df=df,
+                    table_name=shadow_table,
+                    database=database,
+                    schema=schema,
+                    chunk_size=chunk_size,
+                    auto_create_table=not target_exists
+                )
+                
+                if target_exists:
+                    cursor.execute(f"ALTER TABLE {target_name} SWAP WITH {shadow_name}")
+                else:
+                    cursor.execute(f"ALTER TABLE {shadow_name} RENAME TO {target_name}")
+            finally:
+                # After a swap the shadow holds the previous data; after a
+                # failure it holds a partial load. Neither is needed, and a
+                # failed cleanup must not mask the load's own error.
+                try:
+                    cursor.execute(f"DROP TABLE IF EXISTS {shadow_name}")
+                except Exception:
+                    pass
+                cursor.close()
+            
+            return {
+                "success": success,
+                "rows_loaded": num_rows,
+                "chunks": num_chunks
+            }
+            
+        finally:
+            conn.close()
             
     def run_merge(self, database, schema, target_table, source_table, join_keys, update_columns):
         """Run a Snowflake MERGE operation for SCD-1 updates"""
@@ -0,0 +1,48 @@
+"""
+Request-rate limiters shared by every request a FieldRoutes client makes
+
+Each limiter spaces request starts at least min_interval seconds apart no
+matter how many coroutines or threads are issuing requests, so raising
+concurrency overlaps latency instead of multiplying the request rate.
+"""
+import asyncio
+import threading
+import time
+
+class RateLimiter:
+    """Thread-safe rate limiter shared by the worker threads of one client call"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+
+    def wait(self):
+        """Block until this caller may start its request"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_request:
+                time.sleep(self._next_request - now)
+                now = self._next_request
+            self._next_request = now + self.min_interval
+
+class AsyncRateLimiter:
+    """Rate limiter shared by the coroutines of one event loop"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = None
+        self._next_request = 0.0
+
+    async def wait(self):
+        """Wait until this caller may start its request"""
+        if self._lock is None:
+            # Created lazily so the lock binds to the running loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if now < self._next_request:
+                await asyncio.sleep(self._next_request - now)
+                now = self._next_request
+            self._next_request = now + self.min_interval
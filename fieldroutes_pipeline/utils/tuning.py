@@ -0,0 +1,152 @@
+"""
+Volume forecasting and parameter tuning for FieldRoutes extractions
+
+Works from the per-(entity, office) run history kept by ExtractionHistory.
+Each history entry looks like:
+
+    {"run_at": "...", "window_hours": 24.0, "records": 812, "requests": 2,
+     "response_bytes": 1843200, "latency_seconds": 3.4}
+
+window_hours is the length of the incremental time window the run covered,
+or None for full refreshes. Incremental entities run on windows of very
+different lengths (hourly and nightly schedules, catch-up after a failed
+run), so their volumes are forecast as a rate and scaled to the next window.
+"""
+import math
+
+# FieldRoutes search returns at most 1,000 resolved objects with includeData=1
+INCLUDE_DATA_LIMIT = 1000
+
+# FieldRoutes get endpoints accept at most 1,000 IDs
+DEFAULT_BATCH_SIZE = 1000
+MIN_BATCH_SIZE = 100
+TARGET_BATCH_BYTES = 5 * 1024 * 1024
+
+DEFAULT_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+TARGET_FETCH_SECONDS = 60.0
+
+# Measured on the in-memory DataFrame (memory_usage(deep=True)); the
+# compressed Parquet files write_pandas stages are several times smaller
+MIN_CHUNK_ROWS = 10000
+TARGET_CHUNK_BYTES = 100 * 1024 * 1024
+
+# Weight of the newest run in the exponentially weighted forecast
+SMOOTHING = 0.5
+
+def _clamp(value, lower, upper):
+    return max(lower, min(upper, value))
+
+def add_history_entry(entries, run_time, stats, max_entries, window_hours=None):
+    """Return entries plus one for this run, keeping the max_entries newest"""
+    entry = {
+        "run_at": run_time.isoformat(),
+        "window_hours": window_hours,
+        "records": stats["records"],
+        "requests": stats["requests"],
+        "response_bytes": stats["response_bytes"],
+        "latency_seconds": round(stats["latency_seconds"], 3)
+    }
+    return (entries + [entry])[-max_entries:]
+
+def run_volumes(history, window_hours=None):
+    """
+    Record counts of past runs, scaled to a window of window_hours
+
+    With window_hours None (full refresh) the recorded counts are returned
+    as is. Otherwise each run's records-per-hour rate is scaled to the next
+    window, and runs without a recorded window are skipped.
+    """
+    if window_hours is None:
+        return [entry["records"] for entry in history]
+
+    return [
+        entry["records"] / entry["window_hours"] * window_hours
+        for entry in history
+        if entry.get("window_hours")
+    ]
+
+def forecast_records(history, window_hours=None):
+    """Exponentially weighted forecast of the next run's record count"""
+    volumes = run_volumes(history, window_hours)
+    if not volumes:
+        return None
+
+    forecast = volumes[0]
+    for volume in volumes[1:]:
+        forecast = SMOOTHING * volume + (1 - SMOOTHING) * forecast
+
+    return int(math.ceil(forecast))
+
+def bytes_per_record(history):
+    """Average response bytes per record, or None without usable history"""
+    records = sum(entry["records"] for entry in history)
+    if not records:
+        return None
+    return sum(entry["response_bytes"] for entry in history) / records
+
+def seconds_per_request(history):
+    """Average request latency, or None without usable history"""
+    requests = sum(entry["requests"] for entry in history)
+    if not requests:
+        return None
+    return sum(entry["latency_seconds"] for entry in history) / requests
+
+def tune_extraction(history, default_include_data=False, window_hours=None):
+    """
+    Choose extraction parameters for the next run of one (entity, office)
+
+    window_hours is the length of the next incremental window, or None for
+    a full refresh. Returns a dict with forecast_records, include_data,
+    batch_size and concurrency. Without usable history the pipeline
+    defaults are returned.
+    """
+    forecast = forecast_records(history, window_hours)
+    if forecast is None:
+        return {
+            "forecast_records": None,
+            "include_data": default_include_data,
+            "batch_size": DEFAULT_BATCH_SIZE,
+            "concurrency": DEFAULT_CONCURRENCY
+        }
+
+    # Fetch data in the search call only if no recent run outgrew it
+    peak = max(forecast, max(run_volumes(history, window_hours)))
+    include_data = peak < INCLUDE_DATA_LIMIT
+
+    # Size batches so each get response stays around TARGET_BATCH_BYTES
+    batch_size = DEFAULT_BATCH_SIZE
+    record_bytes = bytes_per_record(history)
+    if record_bytes:
+        batch_size = _clamp(int(TARGET_BATCH_BYTES // record_bytes), MIN_BATCH_SIZE, DEFAULT_BATCH_SIZE)
+
+    # Run enough batches in parallel to finish within TARGET_FETCH_SECONDS
+    concurrency = DEFAULT_CONCURRENCY
+    latency = seconds_per_request(history)
+    if latency:
+        batches = math.ceil(forecast / batch_size)
+        concurrency = _clamp(
+            math.ceil(batches * latency / TARGET_FETCH_SECONDS),
+            DEFAULT_CONCURRENCY,
+            MAX_CONCURRENCY
+        )
+
+    return {
+        "forecast_records": forecast,
+        "include_data": include_data,
+        "batch_size": batch_size,
+        "concurrency": concurrency
+    }
+
+def tune_load_chunk_size(record_count, record_bytes):
+    """
+    Rows per write_pandas chunk so each chunk holds about TARGET_CHUNK_BYTES
+
+    record_bytes is the DataFrame's in-memory size per row. Returns None (a
+    single chunk) when the whole load fits in one chunk.
+    """
+    if not record_count or not record_bytes:
+        return None
+    if record_count * record_bytes <= TARGET_CHUNK_BYTES:
+        return None
+    return max(MIN_CHUNK_ROWS, int(TARGET_CHUNK_BYTES // record_bytes))
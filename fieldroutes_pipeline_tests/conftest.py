@@ -0,0 +1,94 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+class FakeFieldRoutesApi:
+    """
+    Minimal FieldRoutes API served by aiohttp on a background thread
+
+    search returns the first `resolved` records plus the remaining IDs;
+    get returns the requested records. Later batches answer faster so
+    responses complete out of order. fail_next / bad_json_next make the
+    next N requests return HTTP 500 / a non-JSON body.
+    """
+
+    def __init__(self, total=25, resolved=5):
+        self.total = total
+        self.resolved = resolved
+        self.fail_next = 0
+        self.bad_json_next = 0
+        self.request_starts = []
+        self.base_url = None
+
+    def _check_faults(self, web):
+        self.request_starts.append(time.monotonic())
+        if self.fail_next:
+            self.fail_next -= 1
+            return web.Response(status=500)
+        if self.bad_json_next:
+            self.bad_json_next -= 1
+            return web.Response(text="<html>maintenance</html>")
+        return None
+
+    def build_app(self):
+        from aiohttp import web
+
+        async def search(request):
+            fault = self._check_faults(web)
+            if fault is not None:
+                return fault
+            entity = request.match_info["entity"]
+            ids = list(range(1, self.total + 1))
+            return web.Response(text=json.dumps({
+                "resolvedObjects": [{f"{entity}ID": i} for i in ids[:self.resolved]],
+                f"{entity}IDsNoDataExported": ids[self.resolved:]
+            }))
+
+        async def get(request):
+            fault = self._check_faults(web)
+            if fault is not None:
+                return fault
+            entity = request.match_info["entity"]
+            ids = (await request.json())[f"{entity}IDs"]
+            # Later batches finish first
+            await asyncio.sleep(max(0.0, 0.05 - ids[0] * 0.001))
+            return web.Response(text=json.dumps([{f"{entity}ID": i} for i in ids]))
+
+        app = web.Application()
+        app.router.add_post("/{entity}/search", search)
+        app.router.add_post("/{entity}/get", get)
+        return app
+
+@pytest.fixture
+def fake_api():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+
+    api = FakeFieldRoutesApi()
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(api.build_app())
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    host, port = runner.addresses[0][:2]
+    api.base_url = f"http://{host}:{port}"
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield api
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+@pytest.fixture
+def credentials(fake_api):
+    pytest.importorskip("dagster")
+    from fieldroutes_pipeline.assets.config import FieldRoutesCredentials
+
+    return FieldRoutesCredentials(office_id=3, base_url=fake_api.base_url, auth_key="key", auth_token="token")
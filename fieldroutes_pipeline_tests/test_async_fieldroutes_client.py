@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("dagster")
+pytest.importorskip("aiohttp")
+pytest.importorskip("requests")
+
+from fieldroutes_pipeline.resources.async_fieldroutes_client import AsyncFieldRoutesClient, SyncFieldRoutesClient
+from fieldroutes_pipeline.resources.fieldroutes_client import FieldRoutesClient
+from fieldroutes_pipeline.utils.rate_limit import AsyncRateLimiter, RateLimiter
+
+def run_extract(client, credentials, **kwargs):
+    async def runner():
+        async with client.open_session() as session:
+            return await client.extract_entity(session, credentials, "customer", {}, **kwargs)
+    return asyncio.run(runner())
+
+def test_async_rate_limiter_spaces_concurrent_starts():
+    async def main():
+        limiter = AsyncRateLimiter(0.02)
+        starts = []
+
+        async def request():
+            await limiter.wait()
+            starts.append(time.monotonic())
+
+        await asyncio.gather(*[request() for _ in range(5)])
+        return starts
+
+    starts = asyncio.run(main())
+    assert all(b - a >= 0.019 for a, b in zip(starts, starts[1:]))
+
+def test_rate_limiter_spaces_concurrent_threads():
+    limiter = RateLimiter(0.02)
+    starts = []
+    threads = [threading.Thread(target=lambda: (limiter.wait(), starts.append(time.monotonic()))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    assert all(b - a >= 0.019 for a, b in zip(starts, starts[1:]))
+
+def test_extract_entity_keeps_batch_order(fake_api, credentials):
+    client = AsyncFieldRoutesClient(throttle_sleep=0)
+    stats = {}
+    records = run_extract(client, credentials, batch_size=3, concurrency=8, stats=stats)
+
+    assert [r["customerID"] for r in records] == list(range(1, fake_api.total + 1))
+    # 1 search + ceil(20 / 3) batches
+    assert stats["requests"] == 8
+    assert stats["records"] == fake_api.total
+
+def test_request_starts_respect_throttle_under_concurrency(fake_api, credentials):
+    client = AsyncFieldRoutesClient(throttle_sleep=0.02)
+    run_extract(client, credentials, batch_size=2, concurrency=8)
+
+    starts = fake_api.request_starts
+    assert len(starts) == 11
+    # Server-side arrival times can jitter slightly around the client's spacing
+    assert all(b - a >= 0.015 for a, b in zip(starts, starts[1:]))
+
+def test_retries_exhausted_raise(fake_api, credentials):
+    fake_api.fail_next = 10
+    client = AsyncFieldRoutesClient(throttle_sleep=0, retry_delay=0.001, max_retries=2)
+
+    with pytest.raises(Exception, match="after 2 retries"):
+        run_extract(client, credentials)
+    assert len(fake_api.request_starts) == 3
+
+def test_non_json_response_is_retried(fake_api, credentials):
+    fake_api.bad_json_next = 1
+    client = AsyncFieldRoutesClient(throttle_sleep=0, retry_delay=0.001)
+
+    records = run_extract(client, credentials)
+    assert len(records) == fake_api.total
+
+def test_sync_adapter_matches_blocking_client(fake_api, credentials):
+    sync_stats, blocking_stats = {}, {}
+    sync_records = SyncFieldRoutesClient(throttle_sleep=0).extract_entity(
+        credentials, "customer", {}, batch_size=4, concurrency=3, stats=sync_stats
+    )
+    blocking_records = FieldRoutesClient(throttle_sleep=0).extract_entity(
+        credentials, "customer", {}, batch_size=4, concurrency=3, stats=blocking_stats
+    )
+
+    assert sync_records == blocking_records
+    for key in ("records", "requests", "response_bytes"):
+        assert sync_stats[key] == blocking_stats[key]
@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("dagster")
+pytest.importorskip("requests")
+
+from fieldroutes_pipeline.resources.fieldroutes_client import FieldRoutesClient
+
+def test_parallel_batch_stats_match_serial(fake_api, credentials):
+    client = FieldRoutesClient(throttle_sleep=0)
+    serial_stats, parallel_stats = {}, {}
+
+    serial = client.extract_entity(credentials, "customer", {}, batch_size=2, concurrency=1, stats=serial_stats)
+    parallel = client.extract_entity(credentials, "customer", {}, batch_size=2, concurrency=4, stats=parallel_stats)
+
+    assert parallel == serial
+    assert [r["customerID"] for r in parallel] == list(range(1, fake_api.total + 1))
+    # 1 search + ceil(20 / 2) batches, merged from the per-thread stats
+    assert parallel_stats["requests"] == serial_stats["requests"] == 11
+    assert parallel_stats["records"] == fake_api.total
+    assert parallel_stats["response_bytes"] == serial_stats["response_bytes"]
+    assert parallel_stats["latency_seconds"] > 0
+
+def test_serial_requests_pause_after_each_response(fake_api, credentials):
+    client = FieldRoutesClient(throttle_sleep=0.03)
+    client.extract_entity(credentials, "customer", {}, batch_size=10, concurrency=1)
+
+    # The pause follows each response: the first get takes ~44ms, so the next
+    # request starts after latency + throttle, not max(latency, throttle)
+    starts = fake_api.request_starts
+    assert len(starts) == 3
+    assert starts[1] - starts[0] >= 0.03
+    assert starts[2] - starts[1] >= 0.04 + 0.03
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("dagster")
+pytest.importorskip("pandas")
+
+from dagster import AssetKey, DagsterInstance, Output, asset, materialize
+
+from fieldroutes_pipeline.assets.common import process_entity
+from fieldroutes_pipeline.assets.config import ExtractionHistory, FieldRoutesCredentials, OfficeMetadata
+
+OFFICE_IDS = [3, 17]
+
+class FakeConfig:
+    def get_all_offices(self):
+        return [
+            (
+                FieldRoutesCredentials(office_id=office_id, base_url="http://fieldroutes", auth_key="k", auth_token="t"),
+                OfficeMetadata(office_id=office_id, last_successful_run_utc=datetime.utcnow() - timedelta(hours=2))
+            )
+            for office_id in OFFICE_IDS
+        ]
+
+    def update_last_run(self, office_id, run_time):
+        pass
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def extract_entity(self, credentials, entity, time_window, batch_size=1000, predict_size=False,
+                       concurrency=1, stats=None):
+        self.calls.append({"office_id": credentials.office_id, "batch_size": batch_size,
+                           "predict_size": predict_size, "concurrency": concurrency})
+        records = [{"customerID": i} for i in range(credentials.office_id * 100)]
+        stats.update({"records": len(records), "requests": 2, "response_bytes": len(records) * 500,
+                      "latency_seconds": 0.5})
+        return records
+
+class FakeSnowflake:
+    def __init__(self):
+        self.loads = []
+
+    def load_dataframe(self, df, database, schema, table, mode="overwrite", chunk_size=None):
+        self.loads.append({"rows": len(df), "mode": mode, "chunk_size": chunk_size})
+        return {"success": True, "rows_loaded": len(df), "chunks": 1}
+
+@asset(required_resource_keys={"field_routes_client", "snowflake_io", "field_routes_config", "extraction_history"})
+def customer_dim(context):
+    record_count, tuning_metadata = process_entity(
+        context,
+        context.resources.field_routes_client,
+        context.resources.snowflake_io,
+        context.resources.field_routes_config,
+        "customer",
+        table="customers",
+        incremental=True,
+        predict_small_dataset=False,
+        extraction_history=context.resources.extraction_history
+    )
+    return Output(value=record_count, metadata={"record_count": record_count, **tuning_metadata})
+
+def run_asset(instance, client, history_resource):
+    snowflake = FakeSnowflake()
+    result = materialize(
+        [customer_dim],
+        instance=instance,
+        resources={
+            "field_routes_client": client,
+            "snowflake_io": snowflake,
+            "field_routes_config": FakeConfig(),
+            "extraction_history": history_resource
+        }
+    )
+    assert result.success
+    materialization = result.asset_materializations_for_node("customer_dim")[0]
+    return {key: value.value for key, value in materialization.metadata.items()}, snowflake
+
+def test_first_run_uses_defaults_and_reports_metadata():
+    client = FakeClient()
+    metadata, snowflake = run_asset(DagsterInstance.ephemeral(), client, ExtractionHistory())
+
+    assert metadata["record_count"] == 2000
+    assert set(metadata["extract_parameters"]) == {"3", "17"}
+    for parameters in metadata["extract_parameters"].values():
+        assert parameters == {"forecast_records": None, "include_data": False, "batch_size": 1000, "concurrency": 1}
+    assert metadata["load_chunk_size"] == 2000
+    assert snowflake.loads == [{"rows": 2000, "mode": "append", "chunk_size": None}]
+
+    history = metadata["extraction_history"]
+    assert set(history) == {"3", "17"}
+    entry = history["3"][0]
+    assert entry["records"] == 300
+    assert entry["requests"] == 2
+    assert entry["window_hours"] == pytest.approx(2, rel=0.01)
+
+def test_history_round_trips_through_materializations():
+    instance = DagsterInstance.ephemeral()
+    history_resource = ExtractionHistory(max_entries=2)
+    run_asset(instance, FakeClient(), history_resource)
+
+    # The second run reads the first run's history back with integer office IDs
+    loaded = history_resource.load(
+        type("Context", (), {"instance": instance, "asset_key": AssetKey("customer_dim")})()
+    )
+    assert set(loaded) == set(OFFICE_IDS)
+
+    client = FakeClient()
+    metadata, _ = run_asset(instance, client, history_resource)
+    assert metadata["extract_parameters"]["3"]["forecast_records"] == pytest.approx(300, rel=0.02)
+    assert metadata["extract_parameters"]["3"]["include_data"] is True
+    assert metadata["extract_parameters"]["17"]["include_data"] is False
+    assert {call["office_id"]: call["predict_size"] for call in client.calls} == {3: True, 17: False}
+
+    # max_entries is applied through the resource
+    metadata, _ = run_asset(instance, FakeClient(), history_resource)
+    assert [len(entries) for entries in metadata["extraction_history"].values()] == [2, 2]
+
+def test_load_without_materialization_is_empty():
+    context = type("Context", (), {"instance": DagsterInstance.ephemeral(), "asset_key": AssetKey("missing")})()
+    assert ExtractionHistory().load(context) == {}
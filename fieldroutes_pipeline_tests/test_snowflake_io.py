@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip("dagster")
+pandas_tools = pytest.importorskip("snowflake.connector.pandas_tools")
+
+from fieldroutes_pipeline.resources.snowflake_io import SnowflakeIO
+
+class FakeCursor:
+    def __init__(self, executed, fail_on=None):
+        self.executed = executed
+        self.fail_on = fail_on
+
+    def execute(self, sql, params=None):
+        self.executed.append(" ".join(sql.split()))
+        if self.fail_on and self.fail_on(sql):
+            raise RuntimeError(f"failed: {sql}")
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, executed, fail_on=None):
+        self.executed = executed
+        self.fail_on = fail_on
+
+    def cursor(self):
+        return FakeCursor(self.executed, self.fail_on)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def swap_env(monkeypatch):
+    env = {"executed": [], "writes": [], "target_exists": True, "fail_on": None, "write_error": None}
+
+    def fake_write_pandas(**kwargs):
+        env["writes"].append(kwargs)
+        if env["write_error"]:
+            raise env["write_error"]
+        return True, 1, len(kwargs["df"]), []
+
+    monkeypatch.setattr(pandas_tools, "write_pandas", fake_write_pandas)
+    monkeypatch.setattr(SnowflakeIO, "get_connection", lambda self, database=None: FakeConnection(env["executed"], env["fail_on"]))
+    monkeypatch.setattr(SnowflakeIO, "create_schema_if_not_exists", lambda self, database, schema: None)
+    monkeypatch.setattr(SnowflakeIO, "table_exists", lambda self, database, schema, table: env["target_exists"])
+    return env
+
+def test_swap_into_existing_table_copies_grants(swap_env):
+    result = SnowflakeIO().load_dataframe([{"employeeID": 1}], "raw", "fieldroutes", "employees", mode="swap")
+
+    assert result["rows_loaded"] == 1
+    assert swap_env["executed"] == [
+        'DROP TABLE IF EXISTS "raw"."fieldroutes"."employees__shadow"',
+        'CREATE TABLE "raw"."fieldroutes"."employees__shadow" LIKE "raw"."fieldroutes"."employees" COPY GRANTS',
+        'ALTER TABLE "raw"."fieldroutes"."employees" SWAP WITH "raw"."fieldroutes"."employees__shadow"',
+        'DROP TABLE IF EXISTS "raw"."fieldroutes"."employees__shadow"',
+    ]
+    write = swap_env["writes"][0]
+    assert write["table_name"] == "employees__shadow"
+    assert write["auto_create_table"] is False
+    assert write.get("quote_identifiers", True) is True
+
+def test_first_swap_creates_and_renames_shadow(swap_env):
+    swap_env["target_exists"] = False
+    SnowflakeIO().load_dataframe([{"officeID": 1}], "raw", "fieldroutes", "offices", mode="swap")
+
+    assert swap_env["executed"] == [
+        'DROP TABLE IF EXISTS "raw"."fieldroutes"."offices__shadow"',
+        'ALTER TABLE "raw"."fieldroutes"."offices__shadow" RENAME TO "raw"."fieldroutes"."offices"',
+        'DROP TABLE IF EXISTS "raw"."fieldroutes"."offices__shadow"',
+    ]
+    assert swap_env["writes"][0]["auto_create_table"] is True
+
+def test_failed_load_keeps_target_and_reports_load_error(swap_env):
+    swap_env["write_error"] = ValueError("load failed")
+    # The cleanup DROP after the load failing too must not hide the load error
+    swap_env["fail_on"] = lambda sql: "DROP" in sql and swap_env["writes"]
+
+    with pytest.raises(ValueError, match="load failed"):
+        SnowflakeIO().load_dataframe([{"employeeID": 1}], "raw", "fieldroutes", "employees", mode="swap")
+
+    assert not any("SWAP WITH" in sql for sql in swap_env["executed"])
@@ -0,0 +1,97 @@
+from datetime import datetime
+
+from fieldroutes_pipeline.utils import tuning
+
+def make_entry(records, window_hours=None, bytes_per_record=2000, latency=1.0):
+    requests = 1 + records // tuning.DEFAULT_BATCH_SIZE
+    return {
+        "run_at": "2024-01-01T00:00:00",
+        "window_hours": window_hours,
+        "records": records,
+        "requests": requests,
+        "response_bytes": records * bytes_per_record,
+        "latency_seconds": requests * latency
+    }
+
+def test_no_history_uses_defaults():
+    for default_include_data in (True, False):
+        result = tuning.tune_extraction([], default_include_data=default_include_data)
+        assert result == {
+            "forecast_records": None,
+            "include_data": default_include_data,
+            "batch_size": tuning.DEFAULT_BATCH_SIZE,
+            "concurrency": tuning.DEFAULT_CONCURRENCY
+        }
+
+def test_small_volume_uses_include_data():
+    history = [make_entry(400), make_entry(600)]
+    result = tuning.tune_extraction(history, default_include_data=False)
+    assert result["forecast_records"] == 500
+    assert result["include_data"] is True
+    assert result["batch_size"] == tuning.DEFAULT_BATCH_SIZE
+    assert result["concurrency"] == tuning.DEFAULT_CONCURRENCY
+
+def test_recent_peak_disables_include_data():
+    history = [make_entry(5000), make_entry(10), make_entry(10), make_entry(10)]
+    result = tuning.tune_extraction(history, default_include_data=True)
+    assert result["forecast_records"] < tuning.INCLUDE_DATA_LIMIT
+    assert result["include_data"] is False
+
+def test_large_volume_raises_concurrency_up_to_max():
+    history = [make_entry(50000, latency=5.0)]
+    result = tuning.tune_extraction(history)
+    assert result["include_data"] is False
+    # 50 batches * 5s / 60s
+    assert result["concurrency"] == 5
+
+    history = [make_entry(1000000, latency=5.0)]
+    assert tuning.tune_extraction(history)["concurrency"] == tuning.MAX_CONCURRENCY
+
+def test_batch_size_clamped_by_record_size():
+    wide = [make_entry(5000, bytes_per_record=20000)]
+    assert tuning.tune_extraction(wide)["batch_size"] == tuning.TARGET_BATCH_BYTES // 20000
+
+    huge = [make_entry(5000, bytes_per_record=1024 * 1024)]
+    assert tuning.tune_extraction(huge)["batch_size"] == tuning.MIN_BATCH_SIZE
+
+    narrow = [make_entry(5000, bytes_per_record=10)]
+    assert tuning.tune_extraction(narrow)["batch_size"] == tuning.DEFAULT_BATCH_SIZE
+
+def test_incremental_forecast_scales_rate_to_window():
+    # Hourly and nightly runs at the same 100 records/hour rate
+    history = [make_entry(100, window_hours=1), make_entry(2400, window_hours=24), make_entry(100, window_hours=1)]
+    assert tuning.forecast_records(history, window_hours=1) == 100
+    assert tuning.forecast_records(history, window_hours=24) == 2400
+
+    hourly = tuning.tune_extraction(history, window_hours=1)
+    nightly = tuning.tune_extraction(history, window_hours=24)
+    assert hourly["include_data"] is True
+    assert nightly["include_data"] is False
+
+def test_incremental_forecast_skips_runs_without_window():
+    history = [make_entry(5000), make_entry(200, window_hours=2)]
+    assert tuning.forecast_records(history, window_hours=1) == 100
+    assert tuning.forecast_records([make_entry(5000)], window_hours=1) is None
+
+def test_load_chunk_size():
+    assert tuning.tune_load_chunk_size(0, 1000) is None
+    assert tuning.tune_load_chunk_size(1000, 1000) is None
+
+    chunk_size = tuning.tune_load_chunk_size(1000000, 1000)
+    assert chunk_size == tuning.TARGET_CHUNK_BYTES // 1000
+
+    assert tuning.tune_load_chunk_size(1000000, 1024 * 1024) == tuning.MIN_CHUNK_ROWS
+
+def test_add_history_entry_trims_to_max_entries():
+    stats = {"records": 10, "requests": 1, "response_bytes": 100, "latency_seconds": 0.12345}
+    entries = []
+    for day in range(1, 6):
+        entries = tuning.add_history_entry(entries, datetime(2024, 1, day), stats, max_entries=3, window_hours=24)
+
+    assert [entry["run_at"] for entry in entries] == [
+        "2024-01-03T00:00:00",
+        "2024-01-04T00:00:00",
+        "2024-01-05T00:00:00"
+    ]
+    assert entries[-1]["window_hours"] == 24
+    assert entries[-1]["latency_seconds"] == 0.123
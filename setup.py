@@ -7,6 +7,7 @@ setup(
         "dagster",
         "pandas",
         "requests",
+        "aiohttp",
         "snowflake-connector-python",
         "pyyaml",
     ],